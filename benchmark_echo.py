@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmarks for the Echo class.
+
+Each benchmark runs its operation many times inside a single timer window
+and repeats the window several times (the ``timeit.Timer.repeat`` pattern),
+so the cost of reading the clock is amortized across a whole batch instead
+of being paid twice per call.
+"""
+
+import array
+import gc
+import os
+import time
+
+from echo import Echo
+
+REPEAT = 7
+# CPython 3.11+ specializes bytecode adaptively after ~8 executions of a
+# call site; warming each operation past that point keeps unspecialized
+# first-run samples out of the measurements.
+WARMUP = 64
+
+
+def benchmark_operation(name, operation, *args, iterations=10000):
+    """Time ``operation(*args)`` over ``iterations`` total calls.
+
+    The calls are split across REPEAT timed windows; each window yields one
+    per-operation sample (window time / calls in the window), which keeps
+    timer overhead negligible even for sub-microsecond operations. Pass a
+    pre-bound callable rather than a wrapping lambda so the measured loop
+    pays no extra frame or attribute lookup per call.
+    """
+    for _ in range(WARMUP):
+        operation(*args)
+
+    # Start each measurement from an empty collector with collection off,
+    # so no GC pause lands inside a timed window.
+    gc.collect()
+    gc.disable()
+
+    number = max(1, iterations // REPEAT)
+    # Integer nanosecond samples in a preallocated array: no float or
+    # list-resize allocations inside the measurement loop.
+    window_ns = array.array("q", [0]) * REPEAT
+    pc = time.perf_counter_ns
+    for w in range(REPEAT):
+        start = pc()
+        for _ in range(number):
+            operation(*args)
+        window_ns[w] = pc() - start
+    times = [ns / number / 1e9 for ns in window_ns]
+
+    # One pass for the mean, one for the variance; cheaper than the exact
+    # Fraction-based summation in the statistics module, and at nanosecond
+    # jitter scale the answers are identical.
+    n = len(times)
+    mean = sum(times) / n
+    stdev = (sum((t - mean) ** 2 for t in times) / (n - 1)) ** 0.5
+
+    print(f"\n{name}")
+    print(f"  windows: {REPEAT} x {number} calls")
+    print(f"  min:    {min(times) * 1e6:10.3f} us/call")
+    print(f"  mean:   {mean * 1e6:10.3f} us/call")
+    print(f"  stdev:  {stdev * 1e6:10.3f} us/call")
+    return times
+
+
+def _quiesce():
+    """Best-effort jitter reduction: pin to one CPU and raise priority.
+
+    Frequency scaling still needs to be pinned externally (e.g.
+    ``cpupower frequency-set -g performance``) for stable numbers.
+    """
+    gc.disable()
+    try:
+        os.sched_setaffinity(0, {0})
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.nice(-10)
+    except (AttributeError, PermissionError):
+        pass
+
+
+def main():
+    _quiesce()
+    print("=" * 50)
+    print("Echo benchmarks")
+    print("=" * 50)
+
+    echo = Echo()
+    echo_with_formatting = Echo(prefix="[", suffix="]")
+
+    # Benchmark 1: simple echo
+    benchmark_operation("Benchmark 1: simple echo",
+                        echo.echo, "Hello World",
+                        iterations=10000)
+    echo.clear_history()
+
+    # Benchmark 2: echo with prefix/suffix formatting
+    benchmark_operation("Benchmark 2: echo with formatting",
+                        echo_with_formatting.echo, "Hello World",
+                        iterations=10000)
+    echo_with_formatting.clear_history()
+
+    # Benchmark 3: echo of a list of 100 words
+    words = ["Word"] * 100
+    benchmark_operation("Benchmark 3: echo list of 100 words",
+                        echo.echo, words,
+                        iterations=1000)
+    echo.clear_history()
+
+    # Benchmark 4: echo of a long string
+    long_text = "x" * 1000
+    benchmark_operation("Benchmark 4: echo long string",
+                        echo.echo, long_text,
+                        iterations=10000)
+    echo.clear_history()
+
+    # Benchmark 5: echo_repeat
+    benchmark_operation("Benchmark 5: echo_repeat x100",
+                        echo.echo_repeat, "Hello", 100, "",
+                        iterations=1000)
+    echo.clear_history()
+
+    # Benchmark 6: get_history with 1000 entries
+    # Populate outside the measured region with a single C-level extend, so
+    # the history size is fixed before timing starts and setup cost stays
+    # out of the samples.
+    echo_history = Echo()
+    msgs = list(map("Message {}".format, range(1000)))
+    echo_history._history.extend(msgs)
+    benchmark_operation("Benchmark 6: get_history (1000 entries)",
+                        echo_history.get_history,
+                        iterations=1000)
+
+    # Benchmark 7: echo_upper
+    benchmark_operation("Benchmark 7: echo_upper",
+                        echo.echo_upper, "hello world test string",
+                        iterations=10000)
+    echo.clear_history()
+
+    # Benchmark 8: echo_reverse
+    benchmark_operation("Benchmark 8: echo_reverse",
+                        echo.echo_reverse, "hello world test string",
+                        iterations=10000)
+    echo.clear_history()
+
+    print("\n" + "=" * 50)
+    print("Done")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""A small dragon battle toy: dragons, lairs, and a simple battle loop."""
+
+import random
+
+
+class Dragon:
+    """A dragon with an element, health, power, and a treasure hoard."""
+
+    __slots__ = ("name", "element", "health", "power", "treasure_hoard",
+                 "is_flying")
+
+    # Compiled once at class creation; display_stats fills it with a single
+    # format_map call instead of re-building a triple-quoted f-string.
+    _STATS_TMPL = (
+        "\n╔══════════════════════════════════╗"
+        "\n║       DRAGON: {name:^16} ║"
+        "\n╠══════════════════════════════════╣"
+        "\n║ Element: {element:^23} ║"
+        "\n║ Health:  {health:^23} ║"
+        "\n║ Power:   {power:^23} ║"
+        "\n║ Flying:  {flying:^23} ║"
+        "\n║ Hoard:   {treasure:^23} ║"
+        "\n╚══════════════════════════════════╝"
+    )
+
+    def __init__(self, name, element="fire", health=100, power=10):
+        self.name = name
+        self.element = element
+        self.health = health
+        self.power = power
+        self.treasure_hoard = []
+        self.is_flying = False
+
+    def display_stats(self):
+        """Return a formatted stat card for this dragon."""
+        return self._STATS_TMPL.format_map({
+            "name": self.name.upper(),
+            "element": self.element,
+            "health": self.health,
+            "power": self.power,
+            "flying": str(self.is_flying),
+            "treasure": len(self.treasure_hoard),
+        })
+
+    def take_flight(self):
+        """Take to the air."""
+        self.is_flying = True
+        return f"{self.name} soars into the sky!"
+
+    def land(self):
+        """Return to the ground."""
+        self.is_flying = False
+        return f"{self.name} lands gracefully."
+
+    def breathe_attack(self, target):
+        """Attack another dragon with elemental breath."""
+        damage = self.power + random.randint(0, 5)
+        target.health = max(0, target.health - damage)
+        return (f"{self.name} breathes {self.element} at {target.name} "
+                f"for {damage} damage!")
+
+    def collect_treasure(self, item):
+        """Add an item to the hoard."""
+        self.treasure_hoard.append(item)
+        return f"{self.name} adds {item} to the hoard."
+
+
+class DragonLair:
+    """A lair holding a collection of dragons."""
+
+    def __init__(self, location):
+        self.location = location
+        self.dragons = []
+        # Parallel columns of the fields summon_dragons reads, so the hot
+        # display loop walks two contiguous lists instead of chasing one
+        # heap object per dragon.
+        self._names = []
+        self._elements = []
+
+    def add_dragon(self, dragon):
+        """House a dragon in this lair."""
+        self.dragons.append(dragon)
+        self._names.append(dragon.name)
+        self._elements.append(dragon.element)
+        return f"{dragon.name} now lives in {self.location}."
+
+    def summon_dragons(self):
+        """Announce every dragon in the lair."""
+        header = f"Dragons of {self.location}:"
+        body = "\n".join(f"  • {name} the {element} dragon arrives!"
+                         for name, element in zip(self._names, self._elements))
+        return f"{header}\n{body}" if body else header
+
+
+def dragon_battle(dragon_a, dragon_b):
+    """Fight two dragons until one drops; return the winner."""
+    attacker, defender = dragon_a, dragon_b
+    while dragon_a.health > 0 and dragon_b.health > 0:
+        print(attacker.breathe_attack(defender))
+        attacker, defender = defender, attacker
+    winner = dragon_a if dragon_a.health > 0 else dragon_b
+    print(winner.display_stats())
+    return winner
+
+
+if __name__ == "__main__":
+    smaug = Dragon("Smaug", element="fire", power=15)
+    frost = Dragon("Frost", element="ice", power=12)
+    lair = DragonLair("the Lonely Mountain")
+    print(lair.add_dragon(smaug))
+    print(lair.add_dragon(frost))
+    print(lair.summon_dragons())
+    dragon_battle(smaug, frost)
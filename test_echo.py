@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Tests for the Echo class."""
+
+import os
+import tempfile
+import time
+import unittest
+
+from echo import Echo, UPPER_ASCII
+
+
+class TestEchoBasic(unittest.TestCase):
+    """Core echo behavior."""
+
+    def setUp(self):
+        self.echo = Echo()
+
+    def test_simple_echo(self):
+        self.assertEqual(self.echo.echo("Hello"), "Hello")
+
+    def test_empty_string(self):
+        self.assertEqual(self.echo.echo(""), "")
+
+    def test_prefix_suffix(self):
+        echo = Echo(prefix="[", suffix="]")
+        self.assertEqual(echo.echo("Hello"), "[Hello]")
+
+    def test_prefix_only(self):
+        echo = Echo(prefix=">> ")
+        self.assertEqual(echo.echo("Hello"), ">> Hello")
+
+    def test_list_input(self):
+        self.assertEqual(self.echo.echo(["a", "b", "c"]), "a b c")
+
+    def test_list_with_non_strings(self):
+        self.assertEqual(self.echo.echo(["a", 1, 2.5]), "a 1 2.5")
+
+    def test_empty_list(self):
+        self.assertEqual(self.echo.echo([]), "")
+
+    def test_echo_repeat(self):
+        self.assertEqual(self.echo.echo_repeat("ab", 3), "ab ab ab")
+
+    def test_echo_repeat_empty_separator(self):
+        self.assertEqual(self.echo.echo_repeat("ab", 3, separator=""), "ababab")
+
+    def test_echo_repeat_zero(self):
+        self.assertEqual(self.echo.echo_repeat("ab", 0), "")
+
+    def test_echo_repeat_negative(self):
+        with self.assertRaises(ValueError):
+            self.echo.echo_repeat("ab", -1)
+
+    def test_echo_upper(self):
+        self.assertEqual(self.echo.echo_upper("hello"), "HELLO")
+
+    def test_echo_lower(self):
+        self.assertEqual(self.echo.echo_lower("HELLO"), "hello")
+
+    def test_echo_reverse(self):
+        self.assertEqual(self.echo.echo_reverse("abc"), "cba")
+
+    def test_echo_translate(self):
+        self.assertEqual(self.echo.echo_translate("abc!", UPPER_ASCII), "ABC!")
+
+    def test_echo_translate_custom_table(self):
+        table = str.maketrans("ab", "ba")
+        self.assertEqual(self.echo.echo_translate("abba", table), "baab")
+
+    def test_make_echo_fn(self):
+        echo = Echo(prefix="<", suffix=">")
+        fn = echo.make_echo_fn()
+        self.assertEqual(fn("x"), "<x>")
+        self.assertEqual(echo.get_history(), ["<x>"])
+
+
+class TestEchoHistory(unittest.TestCase):
+    """History tracking."""
+
+    def setUp(self):
+        self.echo = Echo()
+
+    def test_history_records_results(self):
+        self.echo.echo("one")
+        self.echo.echo("two")
+        self.assertEqual(self.echo.get_history(), ["one", "two"])
+
+    def test_history_records_formatted_results(self):
+        echo = Echo(prefix="[", suffix="]")
+        echo.echo("x")
+        self.assertEqual(echo.get_history(), ["[x]"])
+
+    def test_get_history_returns_copy(self):
+        self.echo.echo("one")
+        history = self.echo.get_history()
+        history.append("tampered")
+        self.assertEqual(self.echo.get_history(), ["one"])
+
+    def test_get_history_no_copy(self):
+        self.echo.echo("one")
+        self.assertEqual(list(self.echo.get_history(copy=False)), ["one"])
+
+    def test_clear_history(self):
+        self.echo.echo("one")
+        self.echo.clear_history()
+        self.assertEqual(self.echo.get_history(), [])
+
+
+class TestEchoFileOperations(unittest.TestCase):
+    """Echoing file contents."""
+
+    def setUp(self):
+        self.echo = Echo()
+
+    def _write_temp(self, content):
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def test_echo_file(self):
+        path = self._write_temp("file contents")
+        self.assertEqual(self.echo.echo_file(path), "file contents")
+
+    def test_echo_file_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            self.echo.echo_file("/nonexistent/path.txt")
+
+    def test_very_long_string(self):
+        content = "x" * 10000
+        path = self._write_temp(content)
+        self.assertEqual(self.echo.echo_file(path), content)
+
+
+@unittest.skipIf(os.environ.get("ECHO_COVERAGE") == "1",
+                 "coverage tracer distorts timing")
+class TestEchoPerformance(unittest.TestCase):
+    """Coarse regression bounds, expressed relative to a calibration run.
+
+    Fixed-second thresholds false-fail on slow CI machines and false-pass on
+    fast ones; measuring a bare loop once and bounding each test as a
+    multiple of it makes the assertions scale with the host.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        start = time.perf_counter()
+        for _ in range(10000):
+            pass
+        cls._loop_cost = time.perf_counter() - start
+
+    def test_large_history_performance(self):
+        echo = Echo()
+        for i in range(1000):
+            echo.echo(f"Message {i}")
+        start = time.perf_counter()
+        for _ in range(1000):
+            echo.get_history()
+        elapsed_time = time.perf_counter() - start
+        self.assertLess(elapsed_time, 200 * self._loop_cost,
+                        "get_history over 1000 entries took too long")
+
+    def test_large_string_performance(self):
+        echo = Echo()
+        text = "x" * (1024 * 1024)
+        start = time.perf_counter()
+        echo.echo(text)
+        elapsed_time = time.perf_counter() - start
+        self.assertLess(elapsed_time, 10 * self._loop_cost,
+                        "echoing a 1MB string took too long")
+
+
+def run_tests_with_coverage():
+    """Run the suite under coverage and print a report."""
+    import coverage
+
+    cov = coverage.Coverage(include=["echo.py"])
+    cov.start()
+    unittest.main(verbosity=2, exit=False)
+    cov.stop()
+    cov.report()
+
+
+if __name__ == "__main__":
+    # Coverage tracing hooks every executed line, which both slows the run
+    # and invalidates the timing assertions above, so it is opt-in only.
+    if os.environ.get("ECHO_COVERAGE") == "1":
+        run_tests_with_coverage()
+    else:
+        unittest.main(verbosity=2)